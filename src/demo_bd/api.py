@@ -7,6 +7,7 @@ from contextlib import asynccontextmanager
 import fastapi_problem_details as problem
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 from starlette_context import plugins
 from starlette_context.middleware import ContextMiddleware
@@ -56,7 +57,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown events.
 
 
-app = FastAPI(lifespan=lifespan, title=settings.APP_TITLE, debug=settings.DEBUG, version="0.1.0")
+app = FastAPI(
+    lifespan=lifespan,
+    title=settings.APP_TITLE,
+    debug=settings.DEBUG,
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 problem.init_app(app, include_exc_info_in_response=True)
 
 
@@ -84,6 +91,7 @@ http_api_routers_include(app=app)
 
 if __name__ == "__main__":
     import argparse
+    import os
 
     import uvicorn
 
@@ -91,6 +99,12 @@ if __name__ == "__main__":
     parser.add_argument("--host", default="0.0.0.0")
     parser.add_argument("--port", type=int, default=8000)
     parser.add_argument("--reload", action="store_true")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (ignored with --reload).",
+    )
     args = parser.parse_args()
 
     uvicorn.run(
@@ -98,6 +112,11 @@ if __name__ == "__main__":
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=None if args.reload else args.workers,
+        # Explicitly select the C event loop and HTTP parser from
+        # uvicorn[standard] instead of relying on auto-detection.
+        loop="uvloop",
+        http="httptools",
         factory=False,
         log_config=None,
         access_log=False,
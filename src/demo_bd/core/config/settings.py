@@ -23,9 +23,9 @@ Uso típico:
 # BUILTIN modules
 import platform
 import sys
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
-from pydantic import computed_field
+from pydantic import Field, computed_field
 
 # SnapEnv base modules
 from snapenv_core.settings.manager import ENVIRONMENT, PLATFORM, SnapEnvCommonSettings
@@ -90,11 +90,15 @@ class DbSettings(SnapEnvCommonSettings):
 
     # Computed settings
     @computed_field  # type: ignore[misc]
-    @property
+    @cached_property
     def dsn(self) -> str:
         """
         Assemble and return the PostgreSQL DSN (connection string) using the configured driver, credentials, host, port, and database.
 
+        The string is assembled once on first access and cached for the
+        lifetime of the instance; settings are immutable after validation,
+        so later accesses skip the f-string rebuild.
+
         Returns
         -------
         str
@@ -103,6 +107,38 @@ class DbSettings(SnapEnvCommonSettings):
         return f"{self.POSTGRES_DRIVER}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
 
+@lru_cache
+def get_db_settings() -> DbSettings:
+    """
+    Retrieve the database settings with caching.
+
+    Reading and validating the environment is done once; subsequent calls
+    (and every ``AppSettings`` instantiation) reuse the same instance.
+
+    Returns
+    -------
+    DbSettings
+        The database settings instance.
+    """
+    return DbSettings()
+
+
+@lru_cache
+def get_security_settings() -> SecuritySettings:
+    """
+    Retrieve the security settings with caching.
+
+    Reading and validating the environment is done once; subsequent calls
+    (and every ``AppSettings`` instantiation) reuse the same instance.
+
+    Returns
+    -------
+    SecuritySettings
+        The security settings instance.
+    """
+    return SecuritySettings()
+
+
 class AppSettings(SnapEnvCommonSettings):
     """
     Main application settings.
@@ -149,8 +185,8 @@ class AppSettings(SnapEnvCommonSettings):
     TENANT_SLUG: str
     LOG_LEVEL: str
     DEBUG: bool
-    DB: DbSettings = DbSettings()
-    SECURITY: SecuritySettings = SecuritySettings()
+    DB: DbSettings = Field(default_factory=get_db_settings)
+    SECURITY: SecuritySettings = Field(default_factory=get_security_settings)
 
     # Computed settings
     @computed_field  # type: ignore[misc]
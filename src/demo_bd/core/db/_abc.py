@@ -1,53 +1,95 @@
 import typing as t
+from contextlib import asynccontextmanager
+from functools import cache
 
 from sqlalchemy import Column, func, select
-from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy import delete as sql_delete
+from sqlalchemy import update as sql_update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import InstrumentedAttribute, selectinload
 
-from demo_bd.core.db.manager import sa_manager
+from demo_bd.core.db.manager import get_default_bind
 
-bind = sa_manager.get_bind()
+bind = get_default_bind()
 
 T = t.TypeVar("T", bound="AbstractModel")
 
 
+@asynccontextmanager
+async def _session_scope(
+    sessionmaker: async_sessionmaker,
+    session: AsyncSession | None,
+) -> t.AsyncIterator[AsyncSession]:
+    """Yield the provided session, or open (and close) a new one from the sessionmaker."""
+    if session is not None:
+        yield session
+    else:
+        async with sessionmaker() as new_session:
+            yield new_session
+
+
+def _column_name(model: type["AbstractModel"], col: InstrumentedAttribute[t.Any]) -> str:
+    """Resolve a column's name, validating it belongs to the model."""
+    name = col.name
+    if name not in model.__table__.columns:
+        raise ValueError(f"Column {name} not found in {model.__name__}")
+    return name
+
+
+# Memoized per (model, column) pair. The cast restores the precise callable
+# signature: mypy types the cache wrapper's arguments as Hashable, which it
+# refuses to match against class objects.
+_cached_column_name = t.cast(
+    "t.Callable[[type[AbstractModel], InstrumentedAttribute[t.Any]], str]",
+    cache(_column_name),
+)
+
+
 class AbstractModel(bind.declarative_base):  # type: ignore
     """Base class for all models."""
 
     __abstract__ = True
     __allow_unmapped__ = True
 
+    @classmethod
+    def _to_dict_fields(cls) -> tuple[tuple[str, str], ...]:
+        """Return cached ``(prefixed_key, column_name)`` pairs for ``to_dict``."""
+        fields = cls.__dict__.get("_to_dict_fields_cache")
+        if fields is None:
+            fields = tuple(
+                (f"{cls.__tablename__}_{col.name}", col.name)
+                for col in t.cast(list[Column], cls.__table__.columns)
+            )
+            cls._to_dict_fields_cache = fields
+        return fields
+
     def to_dict(self) -> dict:
         """Convert the data to a dictionary."""
-        return {
-            f"{self.__tablename__}_{col.name}": getattr(self, col.name)
-            for col in t.cast(list[Column], self.__table__.columns)
-        }
+        return {key: getattr(self, name) for key, name in self._to_dict_fields()}
 
     @staticmethod
     def _get_column(
         model: type[T],
         col: InstrumentedAttribute[t.Any],
     ) -> str:
-        """Get the name of a column in a model."""
-        name = col.name
-        if name not in model.__table__.columns:
-            raise ValueError(f"Column {name} not found in {model.__name__}")
-        return name
+        """Get the name of a column in a model (cached per model/column pair)."""
+        return _cached_column_name(model, col)
 
     @classmethod
+    @cache
     def _get_primary_key(cls) -> str:
-        """Return the primary key of the model."""
+        """Return the primary key of the model (cached per model class)."""
         return cls.__table__.primary_key.columns[0].name
 
     @classmethod
     async def create(
         cls: type[T],
         sessionmaker: async_sessionmaker,
+        session: AsyncSession | None = None,
         **kwargs,
     ) -> T:
         """Create a new record in the database."""
-        async with sessionmaker() as async_session:
+        async with _session_scope(sessionmaker, session) as async_session:
             instance = cls(**kwargs)
             async_session.add(instance)
             await async_session.commit()
@@ -59,9 +101,10 @@ class AbstractModel(bind.declarative_base):  # type: ignore
         cls: type[T],
         sessionmaker: async_sessionmaker,
         primary_key: int,
-    ) -> T:
+        session: AsyncSession | None = None,
+    ) -> T | None:
         """Get a record from the database by its primary key."""
-        async with sessionmaker() as async_session:
+        async with _session_scope(sessionmaker, session) as async_session:
             return await async_session.get(cls, primary_key)
 
     @classmethod
@@ -70,9 +113,10 @@ class AbstractModel(bind.declarative_base):  # type: ignore
         sessionmaker: async_sessionmaker,
         primary_key: int,
         join_tables: t.Any | list[t.Any] = None,
-    ) -> T:
+        session: AsyncSession | None = None,
+    ) -> T | None:
         """Get a record from the database by its primary key."""
-        async with sessionmaker() as async_session:
+        async with _session_scope(sessionmaker, session) as async_session:
             statement = select(cls).filter_by(**{cls._get_primary_key(): primary_key})
             if join_tables is not None:
                 statement = statement.options(selectinload(*join_tables))
@@ -85,9 +129,10 @@ class AbstractModel(bind.declarative_base):  # type: ignore
         sessionmaker: async_sessionmaker,
         key: InstrumentedAttribute[t.Any],
         value: t.Any,
+        session: AsyncSession | None = None,
     ) -> T | None:
         """Get a record by a key."""
-        async with sessionmaker() as async_session:
+        async with _session_scope(sessionmaker, session) as async_session:
             statement = select(cls).filter_by(**{cls._get_column(cls, key): value})
             result = await async_session.execute(statement)
             return result.scalars().first()
@@ -96,10 +141,11 @@ class AbstractModel(bind.declarative_base):  # type: ignore
     async def get_by_filter(
         cls: type[T],
         sessionmaker: async_sessionmaker,
+        session: AsyncSession | None = None,
         **kwargs,
     ) -> T | None:
         """Get a record from the database by a filter."""
-        async with sessionmaker() as async_session:
+        async with _session_scope(sessionmaker, session) as async_session:
             statement = select(cls).filter_by(**kwargs)
             result = await async_session.execute(statement)
             return result.scalars().first()
@@ -109,15 +155,21 @@ class AbstractModel(bind.declarative_base):  # type: ignore
         cls: type[T],
         sessionmaker: async_sessionmaker,
         primary_key: t.Any,
+        session: AsyncSession | None = None,
         **kwargs,
     ) -> T | None:
         """Update a record in the database."""
-        async with sessionmaker() as session:
-            instance = await session.get(cls, primary_key)
+        async with _session_scope(sessionmaker, session) as async_session:
+            statement = (
+                sql_update(cls)
+                .filter_by(**{cls._get_primary_key(): primary_key})
+                .values(**kwargs)
+                .returning(cls)
+            )
+            result = await async_session.execute(statement)
+            instance = result.scalars().first()
             if instance:
-                for key, value in kwargs.items():
-                    setattr(instance, key, value)
-                await session.commit()
+                await async_session.commit()
                 return instance
             return None
 
@@ -127,15 +179,22 @@ class AbstractModel(bind.declarative_base):  # type: ignore
         sessionmaker: async_sessionmaker,
         key: InstrumentedAttribute[t.Any],
         value: t.Any,
+        session: AsyncSession | None = None,
         **kwargs,
     ) -> T | None:
         """Update a record in the database by a key."""
-        async with sessionmaker() as async_session:
-            instance = await cls.get_by_key(sessionmaker, key, value)
+        async with _session_scope(sessionmaker, session) as async_session:
+            pk_col = getattr(cls, cls._get_primary_key())
+            target = (
+                select(pk_col)
+                .filter_by(**{cls._get_column(cls, key): value})
+                .limit(1)
+                .scalar_subquery()
+            )
+            statement = sql_update(cls).where(pk_col == target).values(**kwargs).returning(cls)
+            result = await async_session.execute(statement)
+            instance = result.scalars().first()
             if instance:
-                for attr, new_value in kwargs.items():
-                    setattr(instance, attr, new_value)
-                async_session.add(instance)
                 await async_session.commit()
             return instance
 
@@ -144,12 +203,16 @@ class AbstractModel(bind.declarative_base):  # type: ignore
         cls: type[T],
         sessionmaker: async_sessionmaker,
         primary_key: int,
+        session: AsyncSession | None = None,
     ) -> T | None:
         """Delete a record from the database by its primary key."""
-        async with sessionmaker() as async_session:
-            instance = await cls.get(sessionmaker, primary_key)
+        async with _session_scope(sessionmaker, session) as async_session:
+            statement = (
+                sql_delete(cls).filter_by(**{cls._get_primary_key(): primary_key}).returning(cls)
+            )
+            result = await async_session.execute(statement)
+            instance = result.scalars().first()
             if instance:
-                await async_session.delete(instance)
                 await async_session.commit()
             return instance
 
@@ -159,12 +222,21 @@ class AbstractModel(bind.declarative_base):  # type: ignore
         sessionmaker: async_sessionmaker,
         key: InstrumentedAttribute[t.Any],
         value: t.Any,
+        session: AsyncSession | None = None,
     ) -> T | None:
         """Delete a record from the database by a key."""
-        async with sessionmaker() as async_session:
-            instance = await cls.get_by_key(sessionmaker, key, value)
+        async with _session_scope(sessionmaker, session) as async_session:
+            pk_col = getattr(cls, cls._get_primary_key())
+            target = (
+                select(pk_col)
+                .filter_by(**{cls._get_column(cls, key): value})
+                .limit(1)
+                .scalar_subquery()
+            )
+            statement = sql_delete(cls).where(pk_col == target).returning(cls)
+            result = await async_session.execute(statement)
+            instance = result.scalars().first()
             if instance:
-                await async_session.delete(instance)
                 await async_session.commit()
             return instance
 
@@ -172,13 +244,17 @@ class AbstractModel(bind.declarative_base):  # type: ignore
     async def delete_by_filter(
         cls: type[T],
         sessionmaker: async_sessionmaker,
+        session: AsyncSession | None = None,
         **kwargs,
     ) -> T | None:
         """Delete a record from the database by a filter."""
-        async with sessionmaker() as async_session:
-            instance = await cls.get_by_filter(sessionmaker, **kwargs)
+        async with _session_scope(sessionmaker, session) as async_session:
+            pk_col = getattr(cls, cls._get_primary_key())
+            target = select(pk_col).filter_by(**kwargs).limit(1).scalar_subquery()
+            statement = sql_delete(cls).where(pk_col == target).returning(cls)
+            result = await async_session.execute(statement)
+            instance = result.scalars().first()
             if instance:
-                await async_session.delete(instance)
                 await async_session.commit()
             return instance
 
@@ -186,35 +262,43 @@ class AbstractModel(bind.declarative_base):  # type: ignore
     async def create_or_update(
         cls: type[T],
         sessionmaker: async_sessionmaker,
+        session: AsyncSession | None = None,
         **kwargs,
     ) -> T:
         """Get and update a record from the database by its primary key."""
-        primary_key = kwargs.get(cls._get_primary_key())
-        instance = await cls.get(sessionmaker, primary_key) if primary_key else None
-        if instance:
-            await cls.update(sessionmaker, primary_key, **kwargs)
-            return instance
-        return await cls.create(sessionmaker, **kwargs)
+        async with _session_scope(sessionmaker, session) as async_session:
+            primary_key = kwargs.get(cls._get_primary_key())
+            instance = (
+                await cls.get(sessionmaker, primary_key, session=async_session)
+                if primary_key
+                else None
+            )
+            if instance:
+                await cls.update(sessionmaker, primary_key, session=async_session, **kwargs)
+                return instance
+            return await cls.create(sessionmaker, session=async_session, **kwargs)
 
     @classmethod
     async def exists(
         cls: type[T],
         sessionmaker: async_sessionmaker,
         primary_key: int,
+        session: AsyncSession | None = None,
     ) -> bool:
         """Check if a record exists in the database by its primary key."""
-        async with sessionmaker() as async_session:
+        async with _session_scope(sessionmaker, session) as async_session:
             return await async_session.get(cls, primary_key) is not None
 
     @classmethod
     async def exists_by_filter(
         cls: type[T],
         sessionmaker: async_sessionmaker,
+        session: AsyncSession | None = None,
         **kwargs,
     ) -> bool:
         """Check if a record exists in the database by a filter."""
-        async with sessionmaker() as async_session:
-            statement = select(cls).filter_by(**kwargs).order_by(cls.id.asc())
+        async with _session_scope(sessionmaker, session) as async_session:
+            statement = select(select(cls).filter_by(**kwargs).exists())
             result = await async_session.execute(statement)
             return bool(result.scalar())
 
@@ -227,9 +311,10 @@ class AbstractModel(bind.declarative_base):  # type: ignore
         join_tables: t.Any | list[t.Any] = None,
         filters: t.Sequence[t.Any] | None = None,
         order_by: Column | None = None,
+        session: AsyncSession | None = None,
     ) -> t.Sequence[T]:
         """Get paginated records from the database by a filter."""
-        async with sessionmaker() as async_session:
+        async with _session_scope(sessionmaker, session) as async_session:
             statement = select(cls).limit(page_size).offset((page_number - 1) * page_size)
             if filters is not None:
                 statement = statement.filter(*filters)
@@ -240,6 +325,86 @@ class AbstractModel(bind.declarative_base):  # type: ignore
             result = await async_session.execute(statement)
             return result.scalars().all()
 
+    @classmethod
+    async def paginate_with_total(  # noqa: PLR0913
+        cls: type[T],
+        sessionmaker: async_sessionmaker,
+        page_number: int,
+        page_size: int = 7,
+        *,
+        join_tables: t.Any | list[t.Any] = None,
+        filters: t.Sequence[t.Any] | None = None,
+        order_by: Column | None = None,
+        session: AsyncSession | None = None,
+    ) -> tuple[t.Sequence[T], int]:
+        """Get one page of records plus the total page count in a single query.
+
+        Combines ``paginate`` and ``total_pages`` by attaching a
+        ``COUNT(*) OVER ()`` window column to the page select, so the database
+        computes the unpaginated total while serving the page instead of
+        running a second COUNT(*) query. Returns ``(records, total_pages)``.
+        The window column only exists on returned rows, so a page past the
+        end of the result set falls back to the COUNT query to report the
+        true total.
+        """
+        async with _session_scope(sessionmaker, session) as async_session:
+            statement = (
+                select(cls, func.count().over().label("total"))
+                .limit(page_size)
+                .offset((page_number - 1) * page_size)
+            )
+            if filters is not None:
+                statement = statement.filter(*filters)
+            if join_tables is not None:
+                statement = statement.join(*join_tables).options(selectinload(*join_tables))
+            if order_by is not None:
+                statement = statement.order_by(order_by)
+            result = await async_session.execute(statement)
+            rows = result.all()
+            if not rows:
+                total = await cls.total_pages(
+                    sessionmaker,
+                    page_size=page_size,
+                    join_tables=join_tables,
+                    filters=filters,
+                    session=async_session,
+                )
+                return [], total
+            total_records: int = rows[0][1]
+            return [row[0] for row in rows], (total_records + page_size - 1) // page_size
+
+    @classmethod
+    async def paginate_keyset(  # noqa: PLR0913
+        cls: type[T],
+        sessionmaker: async_sessionmaker,
+        start_from: t.Any | None = None,
+        limit: int = 100,
+        *,
+        join_tables: t.Any | list[t.Any] = None,
+        filters: t.Sequence[t.Any] | None = None,
+        session: AsyncSession | None = None,
+    ) -> t.Sequence[T]:
+        """Get records using keyset (seek) pagination.
+
+        Returns up to ``limit`` records with a primary key greater than
+        ``start_from`` (or from the first record when ``start_from`` is empty),
+        ordered by primary key. Unlike offset pagination, the cost of fetching
+        a page does not grow with its distance from the start, and no COUNT(*)
+        query is needed: pass the last record's primary key as ``start_from``
+        to fetch the next page, until fewer than ``limit`` records come back.
+        """
+        async with _session_scope(sessionmaker, session) as async_session:
+            pk_col = getattr(cls, cls._get_primary_key())
+            statement = select(cls).order_by(pk_col.asc()).limit(limit)
+            if start_from is not None and start_from != "":
+                statement = statement.where(pk_col > start_from)
+            if filters is not None:
+                statement = statement.filter(*filters)
+            if join_tables is not None:
+                statement = statement.join(*join_tables).options(selectinload(*join_tables))
+            result = await async_session.execute(statement)
+            return result.scalars().all()
+
     @classmethod
     async def total_pages(
         cls: type[T],
@@ -247,24 +412,27 @@ class AbstractModel(bind.declarative_base):  # type: ignore
         page_size: int = 7,
         join_tables: t.Any | list[t.Any] = None,
         filters: t.Sequence[t.Any] | None = None,
+        session: AsyncSession | None = None,
     ) -> int:
-        async with sessionmaker() as async_session:
+        async with _session_scope(sessionmaker, session) as async_session:
             statement = select(func.count(cls.__table__.primary_key.columns[0]))
             if filters is not None:
                 statement = statement.filter(*filters)
             if join_tables is not None:
                 statement = statement.join(*join_tables)
             query = await async_session.execute(statement)
-            return (query.scalar() + page_size - 1) // page_size
+            total_records: int = query.scalar() or 0
+            return (total_records + page_size - 1) // page_size
 
     @classmethod
     async def all(
         cls: type[T],
         sessionmaker: async_sessionmaker,
         join_tables: t.Any | list[t.Any] = None,
+        session: AsyncSession | None = None,
     ) -> t.Sequence[T]:
         """Get all records from the database."""
-        async with sessionmaker() as async_session:
+        async with _session_scope(sessionmaker, session) as async_session:
             statement = select(cls)
             if join_tables is not None:
                 statement = statement.options(selectinload(*join_tables))
@@ -276,12 +444,58 @@ class AbstractModel(bind.declarative_base):  # type: ignore
         cls: type[T],
         sessionmaker: async_sessionmaker,
         join_tables: t.Any | list[t.Any] = None,
+        session: AsyncSession | None = None,
         **kwargs,
     ) -> t.Sequence[T]:
         """Get all records from the database by a filter."""
-        async with sessionmaker() as async_session:
+        async with _session_scope(sessionmaker, session) as async_session:
             statement = select(cls).filter_by(**kwargs)
             if join_tables is not None:
                 statement = statement.options(selectinload(*join_tables))
             result = await async_session.execute(statement)
             return result.scalars().all()
+
+    @classmethod
+    async def stream(
+        cls: type[T],
+        sessionmaker: async_sessionmaker,
+        join_tables: t.Any | list[t.Any] = None,
+        yield_per: int = 100,
+        session: AsyncSession | None = None,
+    ) -> t.AsyncIterator[T]:
+        """Iterate over all records using a server-side cursor.
+
+        Streaming variant of ``all``: rows are fetched in batches of
+        ``yield_per`` instead of materializing the whole result set in memory,
+        so arbitrarily large tables can be walked with bounded memory. The
+        session stays open until the iterator is exhausted or closed.
+        """
+        async with _session_scope(sessionmaker, session) as async_session:
+            statement = select(cls).execution_options(yield_per=yield_per)
+            if join_tables is not None:
+                statement = statement.options(selectinload(*join_tables))
+            result = await async_session.stream_scalars(statement)
+            async for instance in result:
+                yield instance
+
+    @classmethod
+    async def stream_by_filter(
+        cls: type[T],
+        sessionmaker: async_sessionmaker,
+        join_tables: t.Any | list[t.Any] = None,
+        yield_per: int = 100,
+        session: AsyncSession | None = None,
+        **kwargs,
+    ) -> t.AsyncIterator[T]:
+        """Iterate over filtered records using a server-side cursor.
+
+        Streaming variant of ``all_by_filter``; see ``stream`` for the
+        batching and memory behavior.
+        """
+        async with _session_scope(sessionmaker, session) as async_session:
+            statement = select(cls).filter_by(**kwargs).execution_options(yield_per=yield_per)
+            if join_tables is not None:
+                statement = statement.options(selectinload(*join_tables))
+            result = await async_session.stream_scalars(statement)
+            async for instance in result:
+                yield instance
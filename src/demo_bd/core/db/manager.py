@@ -1,21 +1,37 @@
 """Database manager and SQLAlchemy configuration for demo_bd."""
 
+from functools import lru_cache
+
 from sqlalchemy_bind_manager import SQLAlchemyBindManager, SQLAlchemyConfig
 
 from demo_bd.core.config.settings import settings
 
+# Pool sizing: enough steady connections for one worker's typical concurrency,
+# with bounded overflow for bursts instead of an unbounded connection storm.
+POOL_SIZE = 10
+POOL_MAX_OVERFLOW = 20
+# How long (seconds) a connection may live before being recycled, keeping the
+# pool ahead of server-side idle timeouts.
+POOL_RECYCLE_SECONDS = 3600
+# Size of the SQLAlchemy asyncpg adapter's per-connection LRU of prepared
+# statements (asyncpg's own cache is bypassed by the dialect); the app uses a
+# small, repetitive set of queries, so a larger cache keeps them all prepared.
+STATEMENT_CACHE_SIZE = 512
+
 bind_config = {
     "default": SQLAlchemyConfig(
         engine_url=settings.DB.dsn,
-        # engine_options=dict(connect_args={"check_same_thread": False}, echo=True),
         engine_options={
             "connect_args": {
                 "server_settings": {
                     "application_name": f"{settings.TENANT_SLUG}_{settings.APP_SLUG}"
                 },
-                "check_same_thread": False,
+                "prepared_statement_cache_size": STATEMENT_CACHE_SIZE,
             },
             "echo": settings.DB.DB_ECHO_DEBUG,
+            "pool_size": POOL_SIZE,
+            "max_overflow": POOL_MAX_OVERFLOW,
+            "pool_recycle": POOL_RECYCLE_SECONDS,
         },
         session_options={"expire_on_commit": False},
         async_engine=True,
@@ -24,3 +40,9 @@ bind_config = {
 
 
 sa_manager = SQLAlchemyBindManager(config=bind_config)
+
+
+@lru_cache
+def get_default_bind():
+    """Return the default bind, resolved once and cached for all callers."""
+    return sa_manager.get_bind()
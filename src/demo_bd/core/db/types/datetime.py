@@ -32,7 +32,12 @@ class DateTimeUTC(TypeDecorator[datetime.datetime]):
         """Process a value before sending to the database, ensuring it is timezone-aware and in UTC."""
         if value is None:
             return value
-        if not value.tzinfo:
+        tzinfo = value.tzinfo
+        if tzinfo is datetime.UTC:
+            # Most values are produced by datetime.now(UTC) defaults; skip the
+            # astimezone round trip for them.
+            return value
+        if not tzinfo:
             msg = "tzinfo is required"
             raise TypeError(msg)
         return value.astimezone(datetime.UTC)
@@ -11,11 +11,16 @@ import abc
 import base64
 import contextlib
 import os
+import platform
 from collections.abc import Callable
+from functools import lru_cache
+from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
+from loguru import logger
 from sqlalchemy import String, Text, TypeDecorator
 from sqlalchemy import func as sql_func
+from sqlalchemy.dialects.postgresql import BYTEA
 
 cryptography = None
 with contextlib.suppress(ImportError):
@@ -23,10 +28,45 @@ with contextlib.suppress(ImportError):
     from cryptography.hazmat.backends import default_backend
     from cryptography.hazmat.primitives import hashes
 
+# Annotated as a module-or-None so type checkers treat the import-guarded
+# branches below as reachable.
+rfernet: ModuleType | None = None
+with contextlib.suppress(ImportError):
+    import rfernet  # type: ignore[no-redef]  # pyright: ignore[reportMissingImports]
+
 if TYPE_CHECKING:
     from sqlalchemy.engine import Dialect
 
 
+def _hw_aes_available() -> bool | None:
+    """Best-effort check for hardware AES support (AES-NI).
+
+    Returns True/False on Linux x86 hosts where /proc/cpuinfo can be read,
+    and None when the answer cannot be determined (other platforms,
+    containers without procfs, non-x86 machines).
+    """
+    if platform.machine() not in {"x86_64", "AMD64", "i386", "i686"}:
+        return None
+    try:
+        with open("/proc/cpuinfo", encoding="ascii", errors="replace") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("flags"):
+                    return "aes" in line.split()
+    except OSError:
+        return None
+    return None
+
+
+# One-time gate at import: OpenSSL silently falls back to its (~10x slower)
+# software AES when the CPU lacks AES-NI, so make that visible instead of
+# debugging mysterious encryption throughput later.
+if _hw_aes_available() is False:  # pragma: nocover
+    logger.warning(
+        "CPU does not report AES-NI support; encrypted column operations will "
+        "use OpenSSL's software AES implementation and run significantly slower."
+    )
+
+
 class EncryptionBackend(abc.ABC):
     """Abstract base class for encryption backends.
 
@@ -34,14 +74,69 @@ class EncryptionBackend(abc.ABC):
     and encrypting/decrypting values for use with SQLAlchemy types.
     """
 
+    __slots__ = ()
+
+    #: True when the backend encrypts inside the database via SQL expressions
+    #: (``bind_expression``/``column_expression``) instead of in Python.
+    server_side = False
+
+    def bind_expression(self, bindvalue: Any) -> Any:
+        """Return the SQL expression wrapping an outgoing bound parameter.
+
+        Backends that encrypt in Python return None, leaving the parameter
+        untouched.
+
+        Args:
+            bindvalue (Any): The bound-parameter expression for the plaintext.
+
+        Returns
+        -------
+            Any: The wrapping SQL expression, or None.
+        """
+        return None
+
+    def column_expression(self, column: Any) -> Any:
+        """Return the SQL expression wrapping a selected column.
+
+        Backends that decrypt in Python return None, selecting the raw column.
+
+        Args:
+            column (Any): The column expression being selected.
+
+        Returns
+        -------
+            Any: The wrapping SQL expression, or None.
+        """
+        return None
+
     def mount_vault(self, key: str | bytes) -> None:
         """Mount the encryption vault with the provided key.
 
+        Normalizes the key to bytes and initializes the engine with it.
+        Backends that derive the engine key differently (e.g. FernetBackend's
+        SHA256 digest) override this.
+
         Args:
             key (str | bytes): The encryption key to use for mounting the vault.
         """
         if isinstance(key, str):
             key = key.encode()
+        self.init_engine(key)
+
+    def is_encrypted(self, value: Any) -> bool:
+        """Tell whether the value already looks like this backend's ciphertext.
+
+        Backends without a recognizable token format return False, so values
+        are (re-)encrypted as before.
+
+        Args:
+            value (Any): The candidate value.
+
+        Returns
+        -------
+            bool: True when the value is already encrypted output.
+        """
+        return False
 
     @abc.abstractmethod
     def init_engine(self, key: bytes | str) -> None:  # pragma: nocover
@@ -76,8 +171,29 @@ class EncryptionBackend(abc.ABC):
         """
 
 
+@lru_cache(maxsize=32)
+def _pgcrypto_passphrase(key: bytes) -> bytes:
+    """Derive (and cache) the base64 passphrase for a pgcrypto key.
+
+    Deployments typically configure a single key shared by every encrypted
+    column, so all PGCryptoBackend instances reuse one encoded passphrase.
+    """
+    return base64.urlsafe_b64encode(key)
+
+
 class PGCryptoBackend(EncryptionBackend):
-    """PG Crypto backend."""
+    """PG Crypto backend.
+
+    Delegates the cipher work to PostgreSQL's pgcrypto extension via the
+    type's compile-time hooks: outgoing bound parameters are wrapped in
+    ``pgp_sym_encrypt`` and selected columns in ``pgp_sym_decrypt``, so the
+    driver only ever sees plain strings and the database performs the
+    encryption while plaintext never makes a Python-side cipher round trip.
+    """
+
+    __slots__ = ("passphrase",)
+
+    server_side = True
 
     def init_engine(self, key: bytes | str) -> None:
         """Initialize the encryption engine with the provided key.
@@ -87,25 +203,57 @@ class PGCryptoBackend(EncryptionBackend):
         """
         if isinstance(key, str):
             key = key.encode()
-        self.passphrase = base64.urlsafe_b64encode(key)
+        self.passphrase = _pgcrypto_passphrase(key)
+
+    def bind_expression(self, bindvalue: Any) -> Any:
+        """Wrap an outgoing bound parameter in ``pgp_sym_encrypt``.
+
+        The passphrase is rendered as a bound parameter as well, so it never
+        appears in the SQL text.
+
+        Args:
+            bindvalue (Any): The bound-parameter expression for the plaintext.
+
+        Returns
+        -------
+            Any: The ``pgp_sym_encrypt`` function expression.
+        """
+        return sql_func.pgp_sym_encrypt(bindvalue, self.passphrase.decode("ascii"))
+
+    def column_expression(self, column: Any) -> Any:
+        """Wrap a selected column in ``pgp_sym_decrypt``.
+
+        Args:
+            column (Any): The ciphertext column expression being selected.
+
+        Returns
+        -------
+            Any: The ``pgp_sym_decrypt`` function expression.
+        """
+        return sql_func.pgp_sym_decrypt(column, self.passphrase.decode("ascii"))
 
     def encrypt(self, value: Any) -> str:
-        """Encrypt the given value and return the encrypted string.
+        """Normalize the outgoing plaintext; the cipher work happens in SQL.
+
+        The value is returned as a plain string for the driver to bind —
+        ``bind_expression`` wraps the parameter in ``pgp_sym_encrypt``.
 
         Args:
             value (Any): The value to encrypt.
 
         Returns
         -------
-            str: The encrypted value as a string.
+            str: The plaintext, normalized to a string.
         """
         if not isinstance(value, str):  # pragma: nocover
             value = repr(value)
-        value = value.encode()
-        return sql_func.pgp_sym_encrypt(value, self.passphrase)  # type: ignore[return-value]
+        return value
 
     def decrypt(self, value: Any) -> str:
-        """Decrypt the given value and return the decrypted string.
+        """Normalize the incoming value, already decrypted by the database.
+
+        ``column_expression`` wraps selected columns in ``pgp_sym_decrypt``,
+        so the row value arriving here is plaintext.
 
         Args:
             value (Any): The value to decrypt.
@@ -116,11 +264,44 @@ class PGCryptoBackend(EncryptionBackend):
         """
         if not isinstance(value, str):  # pragma: nocover
             value = str(value)
-        return sql_func.pgp_sym_decrypt(value, self.passphrase)  # type: ignore[return-value]
+        return value
 
 
 class FernetBackend(EncryptionBackend):
-    """Encryption Using a Fernet backend."""
+    """Encryption Using a Fernet backend.
+
+    Uses the Rust-backed ``rfernet`` implementation when it is installed and
+    transparently falls back to ``cryptography.fernet.Fernet`` otherwise; both
+    produce interchangeable Fernet tokens.
+    """
+
+    __slots__ = ("fernet", "key")
+
+    key: bytes
+    # Either rfernet.Fernet or cryptography.fernet.Fernet, depending on what
+    # is installed.
+    fernet: Any
+
+    # Fernet tokens always begin with base64("\x80" + timestamp...); the
+    # shortest possible token (empty plaintext) is 100 characters.
+    _TOKEN_PREFIX = "gAAAA"
+    _TOKEN_MIN_LENGTH = 100
+
+    def is_encrypted(self, value: Any) -> bool:
+        """Tell whether the value already looks like a Fernet token.
+
+        Args:
+            value (Any): The candidate value.
+
+        Returns
+        -------
+            bool: True when the value is already encrypted output.
+        """
+        return (
+            isinstance(value, str)
+            and len(value) >= self._TOKEN_MIN_LENGTH
+            and value.startswith(self._TOKEN_PREFIX)
+        )
 
     def mount_vault(self, key: str | bytes) -> None:
         """Mount the encryption vault with the provided key.
@@ -144,7 +325,10 @@ class FernetBackend(EncryptionBackend):
         if isinstance(key, str):
             key = key.encode()
         self.key = base64.urlsafe_b64encode(key)
-        self.fernet = Fernet(self.key)  # pyright: ignore[reportPossiblyUnboundVariable]
+        if rfernet is not None:
+            self.fernet = rfernet.Fernet(self.key.decode("ascii"))
+        else:
+            self.fernet = Fernet(self.key)  # pyright: ignore[reportPossiblyUnboundVariable]
 
     def encrypt(self, value: Any) -> str:
         """Encrypt the given value and return the encrypted string.
@@ -159,8 +343,10 @@ class FernetBackend(EncryptionBackend):
         if not isinstance(value, str):
             value = repr(value)
         value = value.encode()
-        encrypted = self.fernet.encrypt(value)
-        return encrypted.decode("utf-8")
+        encrypted: str | bytes = self.fernet.encrypt(value)
+        if not isinstance(encrypted, str):
+            encrypted = encrypted.decode("utf-8")
+        return encrypted
 
     def decrypt(self, value: Any) -> str:
         """Decrypt the given value and return the decrypted string.
@@ -174,7 +360,12 @@ class FernetBackend(EncryptionBackend):
         """
         if not isinstance(value, str):  # pragma: nocover
             value = str(value)
-        decrypted: str | bytes = self.fernet.decrypt(value.encode())
+        if rfernet is not None:
+            decrypted: str | bytes = self.fernet.decrypt(value)
+        else:
+            # Tokens are urlsafe base64, so the cheaper ASCII codec suffices
+            # for handing bytes to the cryptography implementation.
+            decrypted = self.fernet.decrypt(value.encode("ascii"))
         if not isinstance(decrypted, str):
             decrypted = decrypted.decode("utf-8")
         return decrypted
@@ -186,6 +377,10 @@ class EncryptedString(TypeDecorator[str]):
     impl = String
     cache_ok = True
 
+    # No __slots__ here: TypeDecorator.copy() clones instances by copying
+    # __dict__ when building per-dialect impls, so slot-stored attributes
+    # would silently vanish from the copies.
+
     def __init__(
         self,
         key: str | bytes | Callable[[], str | bytes] | None = None,
@@ -197,6 +392,7 @@ class EncryptedString(TypeDecorator[str]):
             key = os.urandom(32)
         self.key = key
         self.backend = backend()
+        self._vault_mounted = False
 
     @property
     def python_type(self) -> type[str]:
@@ -218,12 +414,50 @@ class EncryptedString(TypeDecorator[str]):
         -------
             Any: The SQLAlchemy type descriptor appropriate for the dialect.
         """
+        if self.backend.server_side and dialect.name == "postgresql":
+            # pgp_sym_encrypt produces bytea, so server-side backends store
+            # the raw ciphertext bytes.
+            return dialect.type_descriptor(BYTEA())
         if dialect.name in {"mysql", "mariadb"}:
             return dialect.type_descriptor(Text())
         if dialect.name == "oracle":
             return dialect.type_descriptor(String(length=4000))
         return dialect.type_descriptor(String())
 
+    def bind_expression(self, bindvalue: Any) -> Any:
+        """Give the backend a chance to wrap outgoing bound parameters in SQL.
+
+        Server-side backends (pgcrypto) return an encrypting function
+        expression; Python-side backends leave the parameter untouched.
+
+        Args:
+            bindvalue (Any): The bound-parameter expression.
+
+        Returns
+        -------
+            Any: The expression to render in place of the parameter.
+        """
+        self.mount_vault()
+        expression = self.backend.bind_expression(bindvalue)
+        return bindvalue if expression is None else expression
+
+    def column_expression(self, column: Any) -> Any:
+        """Give the backend a chance to wrap selected columns in SQL.
+
+        Server-side backends (pgcrypto) return a decrypting function
+        expression; Python-side backends select the raw column.
+
+        Args:
+            column (Any): The column expression being selected.
+
+        Returns
+        -------
+            Any: The expression to render in place of the column.
+        """
+        self.mount_vault()
+        expression = self.backend.column_expression(column)
+        return column if expression is None else expression
+
     def process_bind_param(self, value: Any, dialect: Dialect) -> str | None:
         """Encrypt the value before storing it in the database.
 
@@ -238,6 +472,10 @@ class EncryptedString(TypeDecorator[str]):
         if value is None:
             return value
         self.mount_vault()
+        if self.backend.is_encrypted(value):
+            # Already this backend's ciphertext (e.g. a value read from the
+            # database and written back untouched); don't wrap it again.
+            return value
         return self.backend.encrypt(value)
 
     def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
@@ -260,10 +498,17 @@ class EncryptedString(TypeDecorator[str]):
         """Mount the encryption vault using the configured key.
 
         This method resolves the encryption key, calling it if it is a callable,
-        and mounts the vault in the backend with the resolved key.
+        and mounts the vault in the backend with the resolved key. Mounting is
+        done once per type instance and cached: key derivation (e.g. the SHA256
+        digest and Fernet construction of the Fernet backend) is not repeated
+        for every bound or loaded value. Callable keys are therefore resolved
+        a single time for the lifetime of the instance.
         """
+        if self._vault_mounted:
+            return
         key = self.key() if callable(self.key) else self.key
         self.backend.mount_vault(key)
+        self._vault_mounted = True
 
 
 class EncryptedText(EncryptedString):
@@ -282,4 +527,6 @@ class EncryptedText(EncryptedString):
         -------
             Any: The SQLAlchemy type descriptor appropriate for the dialect.
         """
+        if self.backend.server_side and dialect.name == "postgresql":
+            return dialect.type_descriptor(BYTEA())
         return dialect.type_descriptor(Text())
@@ -24,6 +24,11 @@ if TYPE_CHECKING:
 
 UUID_UTILS_INSTALLED = find_spec("uuid_utils")
 
+# Dialects that take the UUID as its string form directly.
+_STR_DIALECTS = frozenset({"postgresql", "duckdb", "cockroachdb", "mssql"})
+# Dialects that take the raw 16-byte form.
+_BYTES_DIALECTS = frozenset({"oracle", "spanner+spanner"})
+
 
 class GUID(TypeDecorator[UUID]):
     """Platform-independent GUID type.
@@ -40,6 +45,10 @@ class GUID(TypeDecorator[UUID]):
     impl = BINARY(16)
     cache_ok = True
 
+    # No __slots__ here: TypeDecorator.copy() clones instances by copying
+    # __dict__ when building per-dialect impls, so slot-stored attributes
+    # would silently vanish from the copies.
+
     @property
     def python_type(self) -> type[UUID]:
         """Return the Python type handled by this custom GUID type."""
@@ -54,6 +63,8 @@ class GUID(TypeDecorator[UUID]):
             **kwargs: Additional keyword arguments passed to the base TypeDecorator.
         """
         self.binary = binary
+        self._bind_strategies: dict[str, Any] = {}
+        self._result_strategies: dict[str, Any] = {}
 
     def load_dialect_impl(self, dialect: Dialect) -> Any:
         """Return the appropriate SQLAlchemy type for the given dialect.
@@ -75,6 +86,36 @@ class GUID(TypeDecorator[UUID]):
             return dialect.type_descriptor(BINARY(16))
         return dialect.type_descriptor(CHAR(32))
 
+    def _make_bind_strategy(self, dialect_name: str) -> Any:
+        """Build the conversion closure for a dialect.
+
+        The dialect-name branching is resolved here exactly once per dialect;
+        the returned closure only performs the conversion itself.
+
+        Args:
+            dialect_name (str): The SQLAlchemy dialect name.
+
+        Returns
+        -------
+            Any: A callable converting a non-None value for that dialect.
+        """
+        if dialect_name in _STR_DIALECTS:
+            return str
+        to_uuid = self.to_uuid
+        if dialect_name in _BYTES_DIALECTS or self.binary:
+
+            def as_bytes(value: Any) -> bytes | None:
+                uuid_value = to_uuid(value)
+                return None if uuid_value is None else uuid_value.bytes
+
+            return as_bytes
+
+        def as_hex(value: Any) -> str | None:
+            uuid_value = to_uuid(value)
+            return None if uuid_value is None else uuid_value.hex
+
+        return as_hex
+
     def process_bind_param(
         self,
         value: bytes | str | UUID | None,
@@ -83,7 +124,10 @@ class GUID(TypeDecorator[UUID]):
         """Process the value before sending it to the database.
 
         Converts the input value to the appropriate format (string, bytes, or hex)
-        depending on the database dialect and the binary setting.
+        depending on the database dialect and the binary setting. The
+        per-dialect conversion strategy is cached on the type instance, so
+        repeated binds pay one dict lookup instead of re-evaluating the
+        dialect branching.
 
         Args:
             value (bytes | str | UUID | None): The value to be processed.
@@ -95,14 +139,11 @@ class GUID(TypeDecorator[UUID]):
         """
         if value is None:
             return value
-        if dialect.name in {"postgresql", "duckdb", "cockroachdb", "mssql"}:
-            return str(value)
-        value = self.to_uuid(value)
-        if value is None:
-            return value
-        if dialect.name in {"oracle", "spanner+spanner"}:
-            return value.bytes
-        return value.bytes if self.binary else value.hex
+        strategy = self._bind_strategies.get(dialect.name)
+        if strategy is None:
+            strategy = self._make_bind_strategy(dialect.name)
+            self._bind_strategies[dialect.name] = strategy
+        return strategy(value)
 
     def process_result_value(
         self,
@@ -126,11 +167,27 @@ class GUID(TypeDecorator[UUID]):
             return value
         if value.__class__.__name__ == "UUID":
             return cast("UUID", value)
-        if dialect.name == "spanner+spanner":
-            return UUID(bytes=b64decode(cast("str | Buffer", value)))
-        if self.binary:
-            return UUID(bytes=cast("bytes", value))
-        return UUID(hex=cast("str", value))
+        strategy = self._result_strategies.get(dialect.name)
+        if strategy is None:
+            # Resolve the dialect branching once, mirroring the bind-side
+            # strategy cache.
+            if dialect.name == "spanner+spanner":
+
+                def strategy(value: Any) -> UUID:
+                    return UUID(bytes=b64decode(cast("str | Buffer", value)))
+
+            elif self.binary:
+
+                def strategy(value: Any) -> UUID:
+                    return UUID(bytes=value)
+
+            else:
+
+                def strategy(value: Any) -> UUID:
+                    return UUID(hex=value)
+
+            self._result_strategies[dialect.name] = strategy
+        return strategy(value)
 
     @staticmethod
     def to_uuid(value: Any) -> UUID | None:
@@ -149,11 +206,13 @@ class GUID(TypeDecorator[UUID]):
         """
         if value.__class__.__name__ == "UUID" or value is None:
             return cast("UUID | None", value)
-        try:
-            value = UUID(hex=value)
-        except (TypeError, ValueError):
-            value = UUID(bytes=value)
-        return cast("UUID | None", value)
+        # Dispatch on the input type directly instead of attempting the hex
+        # constructor and recovering from TypeError on every bytes input.
+        if isinstance(value, str):
+            return UUID(hex=value)
+        if isinstance(value, (bytes, bytearray)):
+            return UUID(bytes=bytes(value))
+        return UUID(hex=value)
 
     def compare_values(self, x: Any, y: Any) -> bool:
         """Compare two values for equality, with special handling for UUIDs.
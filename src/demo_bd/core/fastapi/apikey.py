@@ -5,17 +5,26 @@ from headers, query parameters, or cookies, using project settings.
 """
 
 from collections.abc import Callable
+from functools import lru_cache
+from hmac import compare_digest
 
 from fastapi import HTTPException, Security, status
 from fastapi.security.api_key import APIKeyHeader, APIKeyQuery
 
 
+@lru_cache
 def make_api_key_dependency(
     apikey_name: str,
     apikey_value: str,
 ) -> Callable:
     """Create an API key dependency for FastAPI routes.
 
+    The result is cached per (name, value) pair, so every route guarded with
+    the same key shares one dependency callable and one set of
+    APIKeyHeader/APIKeyQuery scheme objects; FastAPI can then also share the
+    resolved dependency within a request instead of solving it per route
+    signature.
+
     Args:
         apikey_name (str): The name of the API key (header, query, or cookie).
         apikey_value (str): The expected value of the API key.
@@ -28,6 +37,10 @@ def make_api_key_dependency(
     api_key_query = APIKeyQuery(name=apikey_name, auto_error=False)
     # api_key_cookie = APIKeyCookie(name=apikey_name, auto_error=False)
 
+    # compare_digest raises TypeError on non-ASCII str operands, which a
+    # client could trigger; comparing UTF-8 bytes cannot fail.
+    apikey_value_bytes = apikey_value.encode()
+
     async def get_api_key(
         api_key_header_data: str = Security(api_key_header),
         api_key_query_data: str = Security(api_key_query),
@@ -49,11 +62,19 @@ def make_api_key_dependency(
         -------
             str: The validated API key.
         """
-        if api_key_header_data == apikey_value:
+        # compare_digest keeps the comparison constant-time, so response
+        # timing leaks nothing about how much of the key matched.
+        if api_key_header_data is not None and compare_digest(
+            api_key_header_data.encode(), apikey_value_bytes
+        ):
             return api_key_header_data
-        if api_key_query_data == apikey_value:
+        if api_key_query_data is not None and compare_digest(
+            api_key_query_data.encode(), apikey_value_bytes
+        ):
             return api_key_query_data
-        # if api_key_cookie_data == apikey_value:
+        # if api_key_cookie_data is not None and compare_digest(
+        #     api_key_cookie_data.encode(), apikey_value_bytes
+        # ):
         #     return api_key_cookie_data
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -10,12 +10,78 @@ import functools
 import inspect
 import os
 import time
+from collections.abc import Callable
+from typing import Any
 
 from fastapi import Request
 from loguru import logger
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.routing import Route as StarletteRoute
 
+_UNKNOWN_HANDLER_INFO: tuple[str, str, str, str, int] = (
+    "unknown.module.mw_v2",
+    "unknown.handler.mw_v2",
+    "unknown_file_mw_v2.py",
+    "/unknown/path/unknown_file_mw_v2.py",
+    0,
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _handler_log_info(handler) -> tuple[str, str, str, str, int]:
+    """Extract module/function/file/line info for a route handler.
+
+    Route handlers are a small, fixed set, so the inspect/getattr work is done
+    once per handler and memoized; subsequent requests for the same endpoint
+    resolve to a cache hit.
+    """
+    module_name, function_name, filename, pathname, lineno = _UNKNOWN_HANDLER_INFO
+
+    if hasattr(handler, "__module__"):
+        module_name = handler.__module__
+    if hasattr(handler, "__name__"):
+        function_name = handler.__name__
+
+    code_object = getattr(handler, "__code__", None)
+    if code_object:
+        pathname = code_object.co_filename
+        filename = os.path.basename(pathname)
+        lineno = code_object.co_firstlineno
+    else:
+        try:
+            pathname = inspect.getfile(handler)
+            filename = os.path.basename(pathname)
+        except (TypeError, OSError):
+            if module_name != "unknown.module.mw_v2":
+                filename = module_name.split(".")[-1] + ".py"
+                pathname = f"<{module_name.replace('.', '/')}/{filename}> (inferred)"
+    return module_name, function_name, filename, pathname, lineno
+
+
+def _bind_data_from_info(info: tuple[str, str, str, str, int]) -> dict:
+    """Shape a handler-info tuple into the loguru bind payload."""
+    module_name, function_name, filename, pathname, lineno = info
+    return {
+        "_log_record_original_name": module_name,
+        "_log_record_original_filename": filename,
+        "_log_record_original_pathname": pathname,
+        "_log_record_original_lineno": lineno,
+        "_log_record_original_funcName": function_name,
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _handler_bind_data(handler) -> dict:
+    """Return the cached loguru bind payload for a route handler.
+
+    logger.bind copies these entries into each record without mutating the
+    source dict, so one shared dict per handler is safe to reuse.
+    """
+    return _bind_data_from_info(_handler_log_info(handler))
+
+
+_UNKNOWN_BIND_DATA = _bind_data_from_info(_UNKNOWN_HANDLER_INFO)
+
 
 class RouteAccessLogMiddleware(BaseHTTPMiddleware):
     """
@@ -23,89 +89,86 @@ class RouteAccessLogMiddleware(BaseHTTPMiddleware):
 
     Logs request and response details, handler information, and processing time for each route.
     Integrates with Loguru for structured logging, providing enhanced observability for FastAPI applications.
+
+    High-frequency probe paths (health checks, favicon) listed in ``exclude_paths``
+    bypass all timing, handler introspection and logging work.
     """
 
+    DEFAULT_EXCLUDE_PATHS: frozenset[str] = frozenset(
+        {
+            "/v1/health/status",
+            "/favicon.ico",
+        }
+    )
+
+    def __init__(self, app, exclude_paths: set[str] | frozenset[str] | None = None) -> None:
+        super().__init__(app)
+        self.exclude_paths = (
+            frozenset(exclude_paths) if exclude_paths is not None else self.DEFAULT_EXCLUDE_PATHS
+        )
+
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
         """
         Handle the incoming request and log access details.
 
         Processes the request, logs access details including handler information and processing time,
-        and returns the response. Integrates with Loguru for structured logging.
+        and returns the response. Integrates with Loguru for structured logging. Requests for
+        excluded paths are passed straight through without any logging overhead.
         """
-        start_time = time.time()
+        if request.scope["path"] in self.exclude_paths:
+            return await call_next(request)
+
+        start_time = time.perf_counter_ns()
 
         # Process the request first
         response = await call_next(request)
-        process_time = (time.time() - start_time) * 1000
+        process_time = (time.perf_counter_ns() - start_time) / 1_000_000
 
         # Extract handler/module/function/file/line info using helper
-        (
-            module_name,
-            function_name,
-            filename,
-            pathname,
-            lineno,
-        ) = self._extract_handler_info(request)
-
-        client_host = request.client.host if request.client else "unknown_client"
-        url_path = request.url.path
-        if request.url.query:
-            url_path += "?" + request.url.query
-        http_version = request.scope.get("http_version", "1.1")
-
-        log_message = (
-            f'{client_host} - "{request.method} {url_path} HTTP/{http_version}" '
-            f"{response.status_code} ({process_time:.2f}ms)"
-        )
-
-        loguru_override_data = {
-            "_log_record_original_name": module_name,
-            "_log_record_original_filename": filename,
-            "_log_record_original_pathname": pathname,
-            "_log_record_original_lineno": lineno,
-            "_log_record_original_funcName": function_name,
-        }
-
-        logger.bind(**loguru_override_data).info(log_message)
+        loguru_override_data = self._extract_handler_bind_data(request)
+
+        def format_log_message() -> str:
+            # Evaluated lazily by loguru only when the INFO level is enabled,
+            # so a raised log level skips all of the string assembly below.
+            # Path and query come straight from the ASGI scope; building
+            # request.url would parse and assemble a full URL object just to
+            # read two components back out of it.
+            scope = request.scope
+            client_host = request.client.host if request.client else "unknown_client"
+            url_path = scope["path"]
+            query_string = scope.get("query_string", b"")
+            if query_string:
+                url_path += "?" + query_string.decode()
+            http_version = scope.get("http_version", "1.1")
+            return (
+                f'{client_host} - "{request.method} {url_path} HTTP/{http_version}" '
+                f"{response.status_code} ({process_time:.2f}ms)"
+            )
+
+        # The lazy callable is passed positionally: loguru copies keyword
+        # format arguments into record["extra"], which would duplicate the
+        # message as a dynamic extra block in the rendered line.
+        logger.bind(**loguru_override_data).opt(lazy=True).info("{}", format_log_message)
         return response
 
-    def _extract_handler_info(self, request: Request):
-        """Extract handler/module/function/file/line info for logging."""
-        module_name = "unknown.module.mw_v2"
-        function_name = "unknown.handler.mw_v2"
-        filename = "unknown_file_mw_v2.py"
-        pathname = "/unknown/path/unknown_file_mw_v2.py"
-        lineno = 0
+    def _extract_handler_bind_data(self, request: Request) -> dict:
+        """Resolve the loguru bind payload describing the request's handler.
 
-        actual_handler = None
+        Resolves the endpoint callable from the request scope and defers the
+        (memoized) introspection and dict construction to
+        ``_handler_bind_data``, so per-request work is the scope lookup plus a
+        cache hit.
+        """
         route_obj = request.scope.get("route")
 
+        actual_handler: Callable[..., Any] | None
         if isinstance(route_obj, StarletteRoute) and hasattr(route_obj, "endpoint"):
             actual_handler = route_obj.endpoint
-            if isinstance(actual_handler, functools.partial):
-                actual_handler = actual_handler.func
         else:
             actual_handler = request.scope.get("endpoint")
-            if actual_handler and isinstance(actual_handler, functools.partial):
-                actual_handler = actual_handler.func
-
-        if actual_handler:
-            if hasattr(actual_handler, "__module__"):
-                module_name = actual_handler.__module__
-            if hasattr(actual_handler, "__name__"):
-                function_name = actual_handler.__name__
-
-            code_object = getattr(actual_handler, "__code__", None)
-            if code_object:
-                pathname = code_object.co_filename
-                filename = os.path.basename(pathname)
-                lineno = code_object.co_firstlineno
-            else:
-                try:
-                    pathname = inspect.getfile(actual_handler)
-                    filename = os.path.basename(pathname)
-                except (TypeError, OSError):
-                    if module_name != "unknown.module.mw_v2":
-                        filename = module_name.split(".")[-1] + ".py"
-                        pathname = f"<{module_name.replace('.', '/')}/{filename}> (inferred)"
-        return module_name, function_name, filename, pathname, lineno
+        if isinstance(actual_handler, functools.partial):
+            actual_handler = actual_handler.func
+
+        if actual_handler is None:
+            return _UNKNOWN_BIND_DATA
+        return _handler_bind_data(actual_handler)
@@ -4,22 +4,51 @@ This module provides functions and classes to intercept standard logging and rou
 enriching log records with contextual information and custom formatting.
 """
 
+import contextlib
 import logging
 import os
 import platform
-from collections import namedtuple
+import reprlib
 from collections.abc import Iterable
+from datetime import UTC
+from functools import lru_cache
 from itertools import chain
-from pprint import pformat
 from sys import stdout
 from typing import Any, cast
 
-import pendulum
 import stackprinter
 from loguru import logger
 from starlette_context import context
 
-_LoguruFileRecord = namedtuple("_LoguruFileRecord", ["name", "path"])
+
+class _LoguruFileRecord:
+    """Stand-in for the ``file`` object on a loguru record.
+
+    A slotted class is constructed in the per-record patcher hot path; slot
+    attribute reads skip the itemgetter descriptor indirection a namedtuple
+    pays, and instances still pickle normally for enqueued sinks.
+    """
+
+    __slots__ = ("name", "path")
+
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+
+
+# Process-invariant extras, resolved once at import instead of per record.
+_HOST = (os.getenv("HOSTNAME") or os.getenv("COMPUTERNAME") or platform.node()).split(".", 1)[0]
+_PID = os.getpid()
+
+
+def _refresh_pid() -> None:
+    # Rebinding the module-level cache is the purpose of this fork hook.
+    global _PID  # noqa: PLW0603
+    _PID = os.getpid()
+
+
+# Keep the cached pid correct in forked workers (e.g. uvicorn/gunicorn).
+os.register_at_fork(after_in_child=_refresh_pid)
 
 
 def set_log_extras(record):
@@ -33,30 +62,34 @@ def set_log_extras(record):
     Args:
         record (dict): The log record to update.
     """
-    if "datetime" not in record["extra"]:
-        record["extra"]["datetime"] = pendulum.now("UTC")
-    if "host" not in record["extra"]:
-        record["extra"]["host"] = os.getenv(
-            "HOSTNAME", os.getenv("COMPUTERNAME", platform.node())
-        ).split(".")[0]
-    if "pid" not in record["extra"]:
-        record["extra"]["pid"] = os.getpid()
+    extra = record["extra"]
+    if "datetime" not in extra:
+        # Loguru already stamped the record at creation time; converting that
+        # value to UTC is far cheaper than asking pendulum for a new "now" on
+        # every record. isoformat() keeps the rendered value identical to the
+        # previous pendulum string.
+        extra["datetime"] = record["time"].astimezone(UTC).isoformat()
+    extra.setdefault("host", _HOST)
+    extra.setdefault("pid", _PID)
 
     if context.exists():
-        record["extra"].setdefault("correlation_id", context.get("X-Correlation-ID", None))
-        record["extra"].setdefault("request_id", context.get("X-Request-ID", None))
+        # One contextvar read for the underlying dict instead of a separate
+        # proxy lookup per key.
+        ctx = context.data
+        extra.setdefault("correlation_id", ctx.get("X-Correlation-ID"))
+        extra.setdefault("request_id", ctx.get("X-Request-ID"))
     else:
-        record["extra"].setdefault("correlation_id", None)
-        record["extra"].setdefault("request_id", None)
+        extra.setdefault("correlation_id", None)
+        extra.setdefault("request_id", None)
 
-    record["extra"].setdefault("app_name", "app")
+    extra.setdefault("app_name", "app")
 
-    if "_log_record_original_name" in record["extra"]:
-        original_logger_name = record["extra"].pop("_log_record_original_name")
-        original_filename = record["extra"].pop("_log_record_original_filename")
-        original_pathname = record["extra"].pop("_log_record_original_pathname")
-        original_lineno = record["extra"].pop("_log_record_original_lineno")
-        original_func_name = record["extra"].pop("_log_record_original_funcName")
+    if "_log_record_original_name" in extra:
+        original_logger_name = extra.pop("_log_record_original_name")
+        original_filename = extra.pop("_log_record_original_filename")
+        original_pathname = extra.pop("_log_record_original_pathname")
+        original_lineno = extra.pop("_log_record_original_lineno")
+        original_func_name = extra.pop("_log_record_original_funcName")
 
         record["name"] = original_logger_name
         record["file"] = _LoguruFileRecord(name=original_filename, path=original_pathname)
@@ -70,12 +103,21 @@ def set_log_extras(record):
             record["module"] = parts[0] if len(parts) > 1 else record["name"]
 
 
-def format_exception(exc_info):
+_STACKPRINTER_SUPPRESSED_PATHS = [
+    r"lib/python.*/site-packages/starlette",
+    r"lib/python.*/site-packages/uvicorn",
+]
+
+
+def format_exception(exc_info, show_vals: str = "line"):
     """
     Format an exception using stackprinter and return an indented string.
 
     Args:
         exc_info: Exception info tuple as returned by sys.exc_info().
+        show_vals (str): Which frame variables stackprinter reprs; the "line"
+            default only expands variables on the source line of each frame,
+            while "all" walks every local and global.
 
     Returns
     -------
@@ -84,11 +126,9 @@ def format_exception(exc_info):
     msg = stackprinter.format(
         exc_info,
         style="darkbg2",
-        show_vals="all",
-        suppressed_paths=[
-            r"lib/python.*/site-packages/starlette",
-            r"lib/python.*/site-packages/uvicorn",
-        ],
+        show_vals=show_vals,
+        truncate_vals=256,
+        suppressed_paths=_STACKPRINTER_SUPPRESSED_PATHS,
     )
     lines = msg.split("\n")
     lines_indented = ["  ┆ " + line + "\n" for line in lines]
@@ -96,6 +136,45 @@ def format_exception(exc_info):
     return msg_indented
 
 
+# Bounded repr for structured log extras. Unlike pformat, reprlib caps the
+# recursion depth and per-container element count, so accidentally logging a
+# huge, deeply nested or cyclic object cannot stall the formatter.
+_EXTRA_REPR = reprlib.Repr()
+_EXTRA_REPR.maxlevel = 4
+_EXTRA_REPR.maxlist = 20
+_EXTRA_REPR.maxtuple = 20
+_EXTRA_REPR.maxset = 20
+_EXTRA_REPR.maxdict = 20
+_EXTRA_REPR.maxstring = 200
+_EXTRA_REPR.maxother = 200
+
+
+# Static prefix of every log line; built once instead of re-concatenated for
+# each record inside format_record.
+_BASE_FORMAT_STRING = (
+    "<green>{extra[datetime]}</green> | "
+    "<green>{extra[app_name]}</green> | "
+    "<green>{extra[host]}</green> | "
+    "<green>{extra[pid]}</green> | "
+    "<white>{extra[correlation_id]}</white> | "
+    "<blue>{extra[request_id]}</blue> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+    "<level>{message}</level>"
+)
+
+# Complete format for the common case (no custom extras, no exception); most
+# records take this constant instead of rebuilding a template.
+_STATIC_FORMAT_STRING = _BASE_FORMAT_STRING + "\n"
+
+# Extra keys that are part of the base format and never appended dynamically.
+_RESERVED_EXTRA_KEYS = frozenset(
+    {"datetime", "app_name", "host", "pid", "correlation_id", "request_id"}
+)
+
+_ERROR_LEVEL_NO = logger.level("ERROR").no
+
+
 def format_record(record: dict) -> str:
     """
     Format a log record for Loguru output.
@@ -107,25 +186,60 @@ def format_record(record: dict) -> str:
     -------
         str: The formatted log record string.
     """
-    format_string = "<green>{extra[datetime]}</green> | "
-    format_string += "<green>{extra[app_name]}</green> | "
-    format_string += "<green>{extra[host]}</green> | "
-    format_string += "<green>{extra[pid]}</green> | "
-    format_string += "<white>{extra[correlation_id]}</white> | "
-    format_string += "<blue>{extra[request_id]}</blue> | "
-    format_string += "<level>{level: <8}</level> | "
-    format_string += "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-    format_string += "<level>{message}</level>"
-    for key, value in record["extra"].items():
-        if key not in {"datetime", "app_name", "host", "pid", "correlation_id", "request_id"}:
+    extra = record["extra"]
+    if record["exception"] is None and extra.keys() <= _RESERVED_EXTRA_KEYS:
+        # Returning the shared constant lets loguru reuse its parsed template
+        # instead of tokenizing a fresh per-record format string.
+        return _STATIC_FORMAT_STRING
+
+    # Fragments are collected in a list and joined once; repeated string
+    # concatenation would re-copy the growing template for every extra key.
+    parts = [_BASE_FORMAT_STRING]
+    for key, value in extra.items():
+        if key not in _RESERVED_EXTRA_KEYS:
             if not isinstance(value, str):
-                record["extra"][key] = pformat(value, indent=4, compact=True, width=88)
-            format_string += f"\n<level>{key}:\n{{extra[{key}]}}</level>"
+                # Loguru only calls this formatter for records that passed the
+                # sink's level filter, so the repr work never runs for
+                # suppressed records; cheap scalars additionally skip it.
+                if isinstance(value, (int, float, bool, type(None))):
+                    extra[key] = repr(value)
+                else:
+                    extra[key] = _EXTRA_REPR.repr(value)
+            parts.append(f"\n<level>{key}:\n{{extra[{key}]}}</level>")
     if record["exception"] is not None:
-        record["extra"]["stack"] = format_exception(exc_info=record["exception"])
-        format_string += "\n{extra[stack]}"
-    format_string += "\n"
-    return format_string
+        # Full variable dumps are reserved for ERROR and above; lower-level
+        # exception logs keep the much cheaper per-line expansion.
+        show_vals = "all" if record["level"].no >= _ERROR_LEVEL_NO else "line"
+        extra["stack"] = format_exception(exc_info=record["exception"], show_vals=show_vals)
+        parts.append("\n{extra[stack]}")
+    parts.append("\n")
+    return "".join(parts)
+
+
+# Level names resolved against loguru once at import; emit() then replaces a
+# method call plus exception-as-control-flow per record with a dict lookup.
+# Levels registered with loguru after import are added on first miss.
+_LEVEL_MAP: dict[str, str] = {}
+for _level_name in ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"):
+    with contextlib.suppress(ValueError):  # pragma: nocover
+        _LEVEL_MAP[_level_name] = logger.level(_level_name).name
+
+
+@lru_cache(maxsize=512)
+def _bound_logger(name, filename, pathname, lineno, func_name):
+    """Return a logger pre-bound with the original call-site extras.
+
+    Applications log from a bounded set of call sites, so the bind (which
+    clones the logger and copies its extras dict) happens once per site
+    instead of once per intercepted record.
+    """
+    return logger.bind(
+        _log_record_original_name=name,
+        _log_record_original_filename=filename,
+        _log_record_original_pathname=pathname,
+        _log_record_original_lineno=lineno,
+        _log_record_original_funcName=func_name,
+    )
 
 
 class InterceptHandler(logging.Handler):
@@ -149,45 +263,67 @@ class InterceptHandler(logging.Handler):
         if record.name in self.ignore_loggers:
             return
 
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = str(record.levelno)
+        level = _LEVEL_MAP.get(record.levelname)
+        if level is None:
+            try:
+                level = _LEVEL_MAP[record.levelname] = logger.level(record.levelname).name
+            except ValueError:
+                level = str(record.levelno)
 
-        loguru_override_data = {
-            "_log_record_original_name": record.name,
-            "_log_record_original_filename": record.filename,
-            "_log_record_original_pathname": record.pathname,
-            "_log_record_original_lineno": record.lineno,
-            "_log_record_original_funcName": record.funcName,
-        }
-
-        logger_with_context = logger.bind(**loguru_override_data)
+        logger_with_context = _bound_logger(
+            record.name, record.filename, record.pathname, record.lineno, record.funcName
+        )
         logger_with_context.opt(depth=0, exception=record.exc_info).log(level, record.getMessage())
 
 
+_intercept_configured = False
+
+
 def setup_loguru_logging_intercept(
     level: int = logging.DEBUG,
     modules: Iterable[str] | None = None,
     ignore_intercept_loggers: Iterable[str] | None = None,
+    force: bool = False,
 ):
     """
     Set up Loguru to intercept and handle standard logging module logs.
 
     This function configures the logging system to route logs from the standard
     logging module through Loguru, applying custom formatting and context.
+    It is idempotent: once the intercept is in place, later calls return
+    immediately instead of re-running the root/module handler manipulation,
+    unless ``force`` is True.
 
     Args:
         level (int): The minimum logging level to capture (default: logging.DEBUG).
         modules (Iterable[str] | None): Specific logger names to intercept. If None, applies to root and all modules.
         ignore_intercept_loggers (Iterable[str] | None): Logger names to ignore for interception.
+        force (bool): Re-run the setup even if it has already been performed.
     """
+    # The module-level flag is the point: setup mutates process-wide logging
+    # state, and the guard must survive across call sites.
+    global _intercept_configured  # noqa: PLW0603
+    if _intercept_configured and not force:
+        return
+    _intercept_configured = True
+
     modules_to_configure = () if modules is None else modules
+    ignored_loggers = set(ignore_intercept_loggers) if ignore_intercept_loggers else set()
 
-    intercept_handler = InterceptHandler(ignore_loggers=ignore_intercept_loggers)
+    # Giving the handler the threshold level lets standard logging drop
+    # below-level records with a cheap integer comparison in callHandlers,
+    # before loguru's comparatively expensive pipeline is entered.
+    intercept_handler = InterceptHandler(level=level, ignore_loggers=ignored_loggers)
 
     logging.basicConfig(handlers=[intercept_handler], level=level)
 
+    # Drop ignored loggers in the handler's filter step so their records are
+    # rejected before emit() does any work — without muting the source logger,
+    # whose other handlers (e.g. gunicorn's own access log) must keep
+    # receiving records.
+    if ignored_loggers:
+        intercept_handler.addFilter(lambda record: record.name not in ignored_loggers)
+
     for logger_name in chain(("",), modules_to_configure):
         mod_logger = logging.getLogger(logger_name)
         mod_logger.handlers = [intercept_handler]
@@ -199,7 +335,10 @@ def setup_loguru_logging_intercept(
         "format": format_record,  # Certifique-se que format_record está corretamente tipado
         "diagnose": True,
         "backtrace": True,
-        "enqueue": False,
+        # Loguru formats the record in the calling thread and enqueues the
+        # already-rendered message, so only the stdout write and flush move to
+        # the worker thread — that is the part that can block on a slow pipe.
+        "enqueue": True,
     }
 
     logger.configure(
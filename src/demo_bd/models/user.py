@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from sqlalchemy import String, select, text
+from sqlalchemy import String, bindparam, select, text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.dialects.postgresql.json import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
@@ -10,9 +10,9 @@ from sqlalchemy_bind_manager._repository import SQLAlchemyAsyncRepository
 from sqlalchemy_json import mutable_json_type
 
 from demo_bd.core.db.base import SlugKey, UUIDv7AuditBase
-from demo_bd.core.db.manager import sa_manager
+from demo_bd.core.db.manager import get_default_bind
 
-bind = sa_manager.get_bind()
+bind = get_default_bind()
 
 
 class UserModel(bind.declarative_base, UUIDv7AuditBase, SlugKey):  # type: ignore
@@ -38,12 +38,35 @@ class UserModel(bind.declarative_base, UUIDv7AuditBase, SlugKey):  # type: ignor
     __admin_identity__ = "user"
 
 
+# Statements built once at import; per-call work is then just supplying the
+# parameter dict, with SQLAlchemy's compiled-SQL cache keyed on these shared
+# constructs.
+# https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#updating-using-the-excluded-insert-values
+_USER_INSERT_STMT = insert(UserModel).values(
+    name=bindparam("name"),
+    mobile_number=bindparam("mobile_number"),
+    data=bindparam("data"),
+)
+_USER_UPSERT_STMT = _USER_INSERT_STMT.on_conflict_do_update(
+    index_elements=[
+        UserModel.mobile_number,
+    ],
+    set_={
+        "name": _USER_INSERT_STMT.excluded.name,
+        "updated_at": _USER_INSERT_STMT.excluded.updated_at,
+    },
+).returning(UserModel)
+
+_USER_BY_MOBILE_NUMBER_STMT = select(UserModel).where(
+    UserModel.mobile_number == bindparam("mobile_number"),
+)
+
+
 class UserRepository(SQLAlchemyAsyncRepository[UserModel]):
     """Repository for performing async operations on UserModel."""
 
     _model = UserModel
 
-    # https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#updating-using-the-excluded-insert-values
     async def upsert(
         self,
         name: str,
@@ -54,7 +77,7 @@ class UserRepository(SQLAlchemyAsyncRepository[UserModel]):
         Insert a new user or update an existing user with the given mobile_number.
 
         If a user with the specified mobile_number already exists, update their name and updated_at fields.
-        Otherwise, insert a new user with the provided name, whatsapmobile_numberp_uuid, and data.
+        Otherwise, insert a new user with the provided name, mobile_number, and data.
 
         Args:
             name (str): The name of the user.
@@ -68,23 +91,11 @@ class UserRepository(SQLAlchemyAsyncRepository[UserModel]):
         if data is None:
             data = {}
 
-        insert_stmt = insert(self._model).values(
-            name=name,
-            whatsapp_uuid=mobile_number,
-            data=data,
-        )
-        stmt = insert_stmt.on_conflict_do_update(
-            index_elements=[
-                self._model.mobile_number,
-            ],
-            set_={
-                "name": name,
-                "updated_at": insert_stmt.excluded.updated_at,
-            },
-        ).returning(self._model)
-
         async with self._get_session() as session:
-            result = await session.execute(stmt)
+            result = await session.execute(
+                _USER_UPSERT_STMT,
+                {"name": name, "mobile_number": mobile_number, "data": data},
+            )
             return result.scalars().one()
 
     async def find_by_mobile_number(
@@ -101,17 +112,11 @@ class UserRepository(SQLAlchemyAsyncRepository[UserModel]):
         -------
             UserModel | None: The user model instance if found, otherwise None.
         """
-        # stmt = select(self._model).where(
-        #     and_(
-        #         self._model.mobile_number == mobile_number,
-        #     )
-        # )
-        stmt = select(self._model).where(
-            self._model.mobile_number == mobile_number,
-        )
-
         async with self._get_session() as session:
-            result = await session.execute(stmt)
+            result = await session.execute(
+                _USER_BY_MOBILE_NUMBER_STMT,
+                {"mobile_number": mobile_number},
+            )
             return result.scalars().one_or_none()
 
 
@@ -1,5 +1,8 @@
+import time
+
+import orjson
 import pendulum
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from fastapi_problem_details import ProblemException
 
 from demo_bd.core.config.settings import settings
@@ -8,7 +11,19 @@ from demo_bd.core.fastapi.query import ApiQueryParams, api_query_params_dep
 from demo_bd.schemas.app_info import InfoResponseSchema, StatusCheckResponseSchema
 from demo_bd.utils.formatters.datetime_formatter import fmt_datetime_into_iso8601_format
 
-start_time = pendulum.now()
+# Uptime is measured from a monotonic clock (immune to wall-clock jumps);
+# the app metadata is immutable for the process lifetime, so it is read from
+# settings once at import instead of per request.
+_START_MONO = time.monotonic()
+_APP_META = (settings.APP_SLUG, settings.APP_TITLE, settings.APP_VERSION, settings.env)
+
+# The status payload only depends on APP_TITLE, fixed at startup, so the JSON
+# body is serialized exactly once.
+_STATUS_BODY = orjson.dumps(
+    StatusCheckResponseSchema(
+        message=f"Hello, Welcome to {settings.APP_TITLE} Status API!"
+    ).model_dump(by_alias=True)
+)
 
 UNAUTHORIZED_401_RESPONSE = {
     "description": "Unauthorized - Invalid or missing API key",
@@ -26,6 +41,12 @@ UNAUTHORIZED_401_RESPONSE = {
 
 health_info_route = APIRouter(prefix="/v1/health", tags=["health"])
 
+# Built once at import; every route below shares the same dependency callable.
+api_key_dependency = make_api_key_dependency(
+    apikey_name=settings.SECURITY.APIKEY_NAME,
+    apikey_value=settings.SECURITY.APIKEY,
+)
+
 
 @health_info_route.get(
     "/status",
@@ -42,18 +63,17 @@ health_info_route = APIRouter(prefix="/v1/health", tags=["health"])
     response_description="A message confirming the API is up and running.",
     status_code=status.HTTP_200_OK,
     responses={200: {"description": "API is healthy"}, 401: UNAUTHORIZED_401_RESPONSE},
+    response_model=StatusCheckResponseSchema,
+    response_model_exclude_unset=True,
 )
 def status_check(
     query: ApiQueryParams = api_query_params_dep,
-    api_key: str = Depends(
-        make_api_key_dependency(
-            apikey_name=settings.SECURITY.APIKEY_NAME,
-            apikey_value=settings.SECURITY.APIKEY,
-        )
-    ),
-) -> StatusCheckResponseSchema:
+    api_key: str = Depends(api_key_dependency),
+) -> Response:
     """Health status check endpoint. Returns a welcome message indicating the API is up."""
-    return StatusCheckResponseSchema(message=f"Hello, Welcome to {settings.APP_TITLE} Status API!")
+    # Returning a prebuilt Response skips per-request schema serialization;
+    # the response_model above keeps the OpenAPI schema intact.
+    return Response(content=_STATUS_BODY, media_type="application/json")
 
 
 @health_info_route.get(
@@ -71,25 +91,23 @@ def status_check(
     response_description="Application metadata including name, version, timestamp, uptime, and environment.",
     status_code=status.HTTP_200_OK,
     responses={200: {"description": "Application information"}, 401: UNAUTHORIZED_401_RESPONSE},
+    response_model_exclude_unset=True,
 )
 def info(
     query: ApiQueryParams = api_query_params_dep,
-    api_key: str = Depends(
-        make_api_key_dependency(
-            apikey_name=settings.SECURITY.APIKEY_NAME,
-            apikey_value=settings.SECURITY.APIKEY,
-        )
-    ),
+    api_key: str = Depends(api_key_dependency),
 ) -> InfoResponseSchema:
     """Return application information including name, version, timestamp, uptime, and environment."""
-    uptime = round((pendulum.now() - start_time).total_seconds(), 2)
-    return InfoResponseSchema(
-        app_name=settings.APP_SLUG,
-        app_title=settings.APP_TITLE,
-        version=settings.APP_VERSION,
+    app_name, app_title, version, environment = _APP_META
+    # Every field below is generated in-process and correct by construction,
+    # so model_construct skips the Pydantic validation pipeline.
+    return InfoResponseSchema.model_construct(
+        app_name=app_name,
+        app_title=app_title,
+        version=version,
         timestamp=fmt_datetime_into_iso8601_format(pendulum.now()),
-        uptime_seconds=uptime,
-        environment=settings.env,
+        uptime_seconds=round(time.monotonic() - _START_MONO, 2),
+        environment=environment,
     )
 
 
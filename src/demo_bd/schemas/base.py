@@ -1,10 +1,10 @@
 """Base schema definitions for the project."""
 
-from datetime import datetime
+from collections.abc import Mapping
+from typing import Any, Self, cast
 
 from pydantic import BaseModel, ConfigDict
 
-from demo_bd.utils.formatters.datetime_formatter import fmt_datetime_into_iso8601_format
 from demo_bd.utils.formatters.dict_formatter import fmt_dict_key_to_camel_case
 
 
@@ -15,10 +15,39 @@ class BaseSchemaModel(BaseModel):
     for serialization, validation, and field aliasing.
     """
 
+    # Datetime fields are rendered to ISO strings by their producers (see
+    # fmt_datetime_into_iso8601_format); the deprecated v1-style json_encoders
+    # hook would only force a per-field Python callback into pydantic's Rust
+    # serializer, so it is intentionally absent.
     model_config = ConfigDict(
         from_attributes=True,
         validate_assignment=True,
         populate_by_name=True,
-        json_encoders={datetime: fmt_datetime_into_iso8601_format},
         alias_generator=fmt_dict_key_to_camel_case,
     )
+
+    @classmethod
+    def from_trusted(cls, obj: Mapping[str, Any] | Any) -> Self:
+        """
+        Build a schema instance from trusted data without running validation.
+
+        Intended for values that are already known to be well-formed, such as
+        rows loaded from the database, where re-validating every field on each
+        request only burns CPU. Uses ``model_construct`` under the hood, so no
+        validators or type coercion run; never feed it untrusted input.
+
+        Args:
+            obj: A mapping of field names to values, or an object (e.g. an ORM
+                row) whose attributes match the schema fields.
+
+        Returns
+        -------
+            Self: The constructed schema instance.
+        """
+        if isinstance(obj, Mapping):
+            data = dict(obj)
+        else:
+            data = {name: getattr(obj, name) for name in cls.model_fields}
+        # model_construct is typed against the defining class, so the result
+        # is cast back to Self for subclasses.
+        return cast("Self", cls.model_construct(**data))
@@ -4,7 +4,10 @@ import datetime
 
 import pendulum
 
-_TARGET_ISO8601_DATETIME_FORMAT = "YYYY-MM-DDTHH:mm:ss.SSSSSS[Z]"
+# strftime pattern equivalent to pendulum's "YYYY-MM-DDTHH:mm:ss.SSSSSS[Z]"
+# tokens; strftime goes straight to C instead of re-parsing the token string
+# on every call.
+_TARGET_ISO8601_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 
 
 def fmt_datetime_into_iso8601_format(
@@ -64,4 +67,4 @@ def fmt_datetime_into_iso8601_format(
             f"Received type: {type(date_time_obj).__name__}"
         )
 
-    return pdt_utc.format(_TARGET_ISO8601_DATETIME_FORMAT)
+    return pdt_utc.strftime(_TARGET_ISO8601_DATETIME_FORMAT)
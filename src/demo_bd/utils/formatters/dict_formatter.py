@@ -1,10 +1,17 @@
 """Utilities for formatting dictionary."""
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=1024)
 def fmt_dict_key_to_camel_case(dict_key: str) -> str:
     """
     Convert a snake_case dictionary key to camelCase.
 
+    The result is memoized: keys come from a small fixed vocabulary (schema
+    field names), so repeated serializations hit the cache instead of
+    re-splitting and re-joining the same strings.
+
     Args:
         dict_key (str): The dictionary key in snake_case.
 